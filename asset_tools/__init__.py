@@ -0,0 +1,4 @@
+"""
+资源工具集
+把各个独立脚本整合为一个带子命令的命令行程序，Pillow 等重依赖只在需要的子命令中导入
+"""
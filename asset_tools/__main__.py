@@ -0,0 +1,9 @@
+#!/usr/bin/env python3
+"""
+python3 -m asset_tools 入口
+"""
+
+from asset_tools.cli import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+资源工具命令行入口
+子命令的参数和执行逻辑直接复用各脚本的 add_arguments 和 run，
+脚本只在执行时才导入 Pillow，避免未使用的子命令加载 Pillow
+"""
+
+import os
+import sys
+import argparse
+
+import compare_sizes
+import image_cutter
+import jpg_to_png_converter
+import rename_character_mats
+import rename_character_perks
+import rename_cut_images
+from asset_tools import pipeline
+
+# 子命令名称 -> (脚本模块, 帮助信息)
+SCRIPT_COMMANDS = {
+    "cut": (image_cutter, "按行列数切分图片"),
+    "rename": (rename_cut_images, "重命名切片图片"),
+    "rename-mats": (rename_character_mats, "重命名 character-mats 文件"),
+    "rename-perks": (rename_character_perks, "重命名 character-perks 文件"),
+    "convert": (jpg_to_png_converter, "JPG 转换为 PNG"),
+    "compare": (compare_sizes, "比较 JPG 和 PNG 文件大小"),
+    "pipeline": (pipeline, "在同一进程中切分、重命名、转换并比较大小"),
+}
+
+
+def cmd_ingest(args):
+    from asset_tools.tile_store import ingest_sheet, verify_sheet
+    
+    sheet_id = args.id or os.path.splitext(os.path.basename(args.image_path))[0]
+    ingest_sheet(args.image_path, args.rows, args.cols, args.store_dir,
+                 sheet_id, args.tile_size)
+    
+    if not args.no_verify and verify_sheet(args.image_path, args.store_dir, sheet_id):
+        sys.exit(1)
+
+
+def cmd_serve(args):
+    from asset_tools.crop_server import serve
+    
+    serve(args.store_dir, args.host, args.port, args.cache_mb)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="asset_tools", description="资源处理工具集")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    for name, (module, help_text) in SCRIPT_COMMANDS.items():
+        p = subparsers.add_parser(name, help=help_text)
+        module.add_arguments(p)
+        p.set_defaults(func=module.run)
+    
+    p = subparsers.add_parser("ingest", help="把整张图片转换为分块存储")
+    p.add_argument("image_path", help="输入图片路径")
+    p.add_argument("rows", type=int, help="卡牌行数")
+    p.add_argument("cols", type=int, help="卡牌列数")
+    p.add_argument("store_dir", help="存储目录")
+    p.add_argument("--id", help="图片编号 (默认: 输入文件名)")
+    p.add_argument("--tile-size", type=int, default=256, help="分块边长 (默认: 256)")
+    p.add_argument("--no-verify", action='store_true',
+                   help="跳过存储后与切分结果的逐像素比较")
+    p.set_defaults(func=cmd_ingest)
+    
+    p = subparsers.add_parser("serve", help="启动单张卡牌裁剪服务")
+    p.add_argument("store_dir", help="存储目录")
+    p.add_argument("--host", default="127.0.0.1", help="监听地址 (默认: 127.0.0.1)")
+    p.add_argument("--port", type=int, default=8000, help="监听端口 (默认: 8000)")
+    p.add_argument("--cache-mb", type=int, default=64, help="缓存大小 MB (默认: 64)")
+    p.set_defaults(func=cmd_serve)
+    
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    
+    try:
+        args.func(args)
+    except KeyboardInterrupt:
+        print("\n\n操作被用户中断")
+        sys.exit(1)
+    except Exception as e:
+        print(f"错误: {e}")
+        sys.exit(1)
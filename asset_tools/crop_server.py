@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+单张卡牌裁剪服务
+从分块存储中按需裁剪卡牌：GET /sheet/{id}/card/{n} 返回第 n 张卡牌的 PNG，
+热点卡牌缓存在按字节数限制大小的 LRU 缓存中
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+from asset_tools.tile_store import load_store
+
+CARD_PATH = re.compile(r'^/sheet/([^/]+)/card/(\d+)$')
+
+
+class ByteLRUCache:
+    """按字节总数限制大小的 LRU 缓存"""
+    
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+    
+    def put(self, key, value):
+        if len(value) > self.max_bytes:
+            return
+        
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.current_bytes -= len(old)
+            
+            self._items[key] = value
+            self.current_bytes += len(value)
+            
+            # 淘汰最久未使用的项
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self.current_bytes -= len(evicted)
+
+
+def make_handler(sheets, cache):
+    """
+    创建绑定了图片索引和缓存的请求处理类
+    
+    Args:
+        sheets (dict): 图片编号 -> TiledSheet
+        cache (ByteLRUCache): 裁剪结果缓存
+    
+    Returns:
+        type: BaseHTTPRequestHandler 子类
+    """
+    class CropHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            # 忽略查询参数，图片编号可以是百分号编码
+            match = CARD_PATH.match(urlsplit(self.path).path)
+            if not match:
+                self.send_error(404, "Not Found")
+                return
+            
+            sheet_id, number = unquote(match.group(1)), int(match.group(2))
+            sheet = sheets.get(sheet_id)
+            if sheet is None or not 1 <= number <= sheet.card_count:
+                self.send_error(404, "Not Found")
+                return
+            
+            key = (sheet_id, number)
+            data = cache.get(key)
+            if data is None:
+                try:
+                    data = sheet.encode_card(number)
+                except Exception as e:
+                    self.send_error(500, f"Crop failed: {e}")
+                    return
+                cache.put(key, data)
+            
+            self.send_response(200)
+            self.send_header('Content-Type', 'image/png')
+            self.send_header('Content-Length', str(len(data)))
+            self.send_header('Cache-Control', 'max-age=60')
+            self.end_headers()
+            self.wfile.write(data)
+    
+    return CropHandler
+
+
+def serve(store_dir, host='127.0.0.1', port=8000, cache_mb=64):
+    """
+    启动裁剪服务
+    
+    Args:
+        store_dir (str): 分块存储目录
+        host (str): 监听地址
+        port (int): 监听端口
+        cache_mb (int): 缓存大小（MB）
+    """
+    sheets = load_store(store_dir)
+    cache = ByteLRUCache(cache_mb * 1024 * 1024)
+    server = ThreadingHTTPServer((host, port), make_handler(sheets, cache))
+    
+    print(f"已加载 {len(sheets)} 张图片: {', '.join(sheets) or '无'}")
+    print(f"缓存大小: {cache_mb} MB")
+    print(f"服务地址: http://{host}:{port}/sheet/{{id}}/card/{{n}}")
+    
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
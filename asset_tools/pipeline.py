@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+切分 -> 重命名 -> 转换 -> 比较 流水线
+整张图片只解码一次，切出的小图片直接在内存中传给后续步骤，不写入中间文件
+"""
+
+import os
+import sys
+
+
+def run_pipeline(image_path, rows, cols, output_dir, prefix, suffix,
+                 start_number=1, quality_level='high', overwrite=False):
+    """
+    在同一进程中完成切分、重命名、转换和大小比较
+    
+    Args:
+        image_path (str): 输入图片路径
+        rows (int): 切分行数
+        cols (int): 切分列数
+        output_dir (str): 输出目录
+        prefix (str): 文件名前缀 (如 'be' 表示 boat event)
+        suffix (str): 文件名后缀 (如 'f' 表示 front, 'b' 表示 back)
+        start_number (int): 起始编号
+        quality_level (str): 质量级别，默认 high 为无损，与 cut + rename 结果逐像素一致
+            (不含透明像素的 RGBA 会保存为 RGB)；其他级别会量化颜色
+        overwrite (bool): 是否覆盖已存在的文件
+    
+    Returns:
+        dict: 处理统计信息
+    """
+    from image_cutter import open_sheet, iter_pieces
+    from rename_cut_images import cut_image_name
+    from jpg_to_png_converter import save_optimized_png
+    from compare_sizes import format_size
+
+    if not os.path.exists(image_path):
+        raise FileNotFoundError(f"图片文件不存在: {image_path}")
+    
+    os.makedirs(output_dir, exist_ok=True)
+    
+    converted = 0
+    skipped = 0
+    total_output_size = 0
+    
+    # 与 cut_image 使用相同的解码方式
+    with open_sheet(image_path) as img:
+        print(f"原图尺寸: {img.size[0]} x {img.size[1]} 像素")
+        print(f"输出目录: {output_dir}")
+        print("-" * 60)
+        
+        for row, col, piece in iter_pieces(img, rows, cols):
+            # 重命名：直接生成最终文件名
+            output_filename = cut_image_name(row, col, prefix, suffix, start_number)
+            output_path = os.path.join(output_dir, output_filename)
+            
+            if os.path.exists(output_path) and not overwrite:
+                skipped += 1
+                print(f"  - 文件已存在，跳过: {output_filename}")
+                continue
+            
+            # 转换：内存中的小图片直接优化并保存为 PNG
+            save_optimized_png(piece, output_path, quality_level)
+            
+            output_size = os.path.getsize(output_path)
+            total_output_size += output_size
+            converted += 1
+            print(f"  ✓ 第{row}行第{col}列 -> {output_filename} ({format_size(output_size)})")
+    
+    # 比较：原图与输出文件的大小
+    input_size = os.path.getsize(image_path)
+    
+    print("-" * 60)
+    print("处理完成!")
+    print(f"成功生成: {converted}")
+    print(f"跳过文件: {skipped}")
+    if converted > 0:
+        print(f"大小变化: {format_size(input_size)} -> {format_size(total_output_size)} "
+              f"({(total_output_size / input_size - 1) * 100:+.1f}%)")
+    
+    return {
+        'converted': converted,
+        'skipped': skipped,
+        'input_size': input_size,
+        'total_output_size': total_output_size
+    }
+
+
+def add_arguments(parser):
+    parser.add_argument("image_path", help="输入图片路径")
+    parser.add_argument("rows", type=int, help="切分行数")
+    parser.add_argument("cols", type=int, help="切分列数")
+    parser.add_argument("output", help="输出目录")
+    parser.add_argument("prefix", help="文件名前缀 (如: be, oe, re)")
+    parser.add_argument("suffix", help="文件名后缀 (如: f, b)")
+    parser.add_argument("--start", type=int, default=1, help="起始编号 (默认为1)")
+    parser.add_argument("-q", "--quality", choices=['high', 'medium', 'low', 'palette'],
+                        default='high',
+                        help="质量级别 (默认: high - 无损，与 cut + rename 结果逐像素一致；medium/low/palette 会量化颜色)")
+    parser.add_argument("--overwrite", action='store_true', help="覆盖已存在的文件")
+
+
+def run(args):
+    try:
+        run_pipeline(args.image_path, args.rows, args.cols, args.output,
+                     args.prefix, args.suffix, args.start, args.quality, args.overwrite)
+    except Exception as e:
+        print(f"错误: {e}")
+        sys.exit(1)
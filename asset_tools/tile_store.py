@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+分块存储的整张图片
+每张图片只保存一次：按固定尺寸分块后逐块编码为 PNG，拼接成一个 .tiles 文件，
+并在同名 .json 索引中记录 .tiles 文件名、每个分块的偏移和长度以及调色板。
+读取某个区域时只解码与之相交的分块。
+.tiles 文件名带有内容摘要，重新存储时先写入新文件再原子替换索引，
+正在运行的服务仍持有旧文件，不会读到不匹配的偏移。
+"""
+
+import hashlib
+import io
+import json
+import os
+
+from PIL import Image
+
+from image_cutter import open_sheet, iter_pieces, piece_box
+
+
+def is_valid_sheet_id(sheet_id):
+    """图片编号必须是普通文件名，不能包含路径分隔符或 '..'"""
+    if not sheet_id or sheet_id in ('.', '..'):
+        return False
+    separators = [os.sep, os.altsep, '/']
+    return not any(sep and sep in sheet_id for sep in separators)
+
+
+def ingest_sheet(image_path, rows, cols, store_dir, sheet_id=None, tile_size=256):
+    """
+    把整张图片转换为分块存储
+    
+    Args:
+        image_path (str): 输入图片路径
+        rows (int): 卡牌行数
+        cols (int): 卡牌列数
+        store_dir (str): 存储目录
+        sheet_id (str): 图片编号，默认为输入文件名（不含扩展名）
+        tile_size (int): 分块边长（像素）
+    
+    Returns:
+        dict: 索引信息
+    """
+    if not os.path.exists(image_path):
+        raise FileNotFoundError(f"图片文件不存在: {image_path}")
+    
+    if sheet_id is None:
+        sheet_id = os.path.splitext(os.path.basename(image_path))[0]
+    if not is_valid_sheet_id(sheet_id):
+        raise ValueError(f"图片编号必须是普通文件名: {sheet_id}")
+    if rows <= 0 or cols <= 0 or tile_size <= 0:
+        raise ValueError(f"行数、列数和分块边长必须大于 0: {rows}, {cols}, {tile_size}")
+    
+    # 与 cut_image 使用相同的解码方式
+    with open_sheet(image_path) as img:
+        width, height = img.size
+        if width < cols or height < rows:
+            raise ValueError(f"图片尺寸 {width} x {height} 小于 {rows} 行 {cols} 列，无法切分")
+        
+        os.makedirs(store_dir, exist_ok=True)
+        tiles = []
+        digest = hashlib.sha1()
+        
+        temp_tiles_path = os.path.join(store_dir, f"{sheet_id}.tiles.tmp")
+        with open(temp_tiles_path, 'wb') as f:
+            for top in range(0, height, tile_size):
+                for left in range(0, width, tile_size):
+                    box = (left, top, min(left + tile_size, width), min(top + tile_size, height))
+                    buffer = io.BytesIO()
+                    img.crop(box).save(buffer, format='PNG', compress_level=9)
+                    data = buffer.getvalue()
+                    tiles.append([f.tell(), len(data)])
+                    f.write(data)
+                    digest.update(data)
+        
+        index = {
+            'tiles_file': f"{sheet_id}.{digest.hexdigest()[:12]}.tiles",
+            'mode': img.mode,
+            'width': width,
+            'height': height,
+            'rows': rows,
+            'cols': cols,
+            'tile_size': tile_size,
+            'tiles': tiles
+        }
+        
+        # 调色板和透明色在拼接区域时需要还原
+        if img.mode == 'P':
+            index['palette'] = img.getpalette()
+        transparency = img.info.get('transparency')
+        if transparency is not None:
+            index['transparency'] = list(transparency) if isinstance(transparency, (bytes, tuple)) else transparency
+    
+    index_path = os.path.join(store_dir, f"{sheet_id}.json")
+    old_tiles_file = None
+    if os.path.exists(index_path):
+        try:
+            with open(index_path) as f:
+                old_tiles_file = json.load(f).get('tiles_file')
+        except (OSError, ValueError, AttributeError):
+            pass
+    
+    # 先放好新的 .tiles 文件，再原子替换索引
+    os.replace(temp_tiles_path, os.path.join(store_dir, index['tiles_file']))
+    temp_index_path = index_path + '.tmp'
+    with open(temp_index_path, 'w') as f:
+        json.dump(index, f)
+    os.replace(temp_index_path, index_path)
+    
+    # 删除旧的 .tiles 文件，已打开它的服务进程不受影响
+    if old_tiles_file and old_tiles_file != index['tiles_file'] and is_valid_sheet_id(old_tiles_file):
+        try:
+            os.remove(os.path.join(store_dir, old_tiles_file))
+        except OSError:
+            pass
+    
+    print(f"已存储: {sheet_id} ({width} x {height} 像素, {len(tiles)} 个分块, {rows} 行 {cols} 列卡牌)")
+    return index
+
+
+class TiledSheet:
+    """分块存储中的一张图片，只按需读取和解码分块"""
+    
+    def __init__(self, store_dir, sheet_id):
+        self.sheet_id = sheet_id
+        with open(os.path.join(store_dir, f"{sheet_id}.json")) as f:
+            index = json.load(f)
+        
+        self.mode = index['mode']
+        self.width = index['width']
+        self.height = index['height']
+        self.rows = index['rows']
+        self.cols = index['cols']
+        self.tile_size = index['tile_size']
+        self.tiles = index['tiles']
+        self.tiles_per_row = -(-self.width // self.tile_size)
+        self.palette = index.get('palette')
+        
+        self.transparency = index.get('transparency')
+        if isinstance(self.transparency, list):
+            self.transparency = bytes(self.transparency) if self.mode == 'P' else tuple(self.transparency)
+        
+        tiles_file = index['tiles_file']
+        if not is_valid_sheet_id(tiles_file):
+            raise ValueError(f"分块文件名无效: {tiles_file}")
+        
+        # 一直持有打开的文件，重新存储替换文件后仍读取与索引匹配的旧文件
+        self.fd = os.open(os.path.join(store_dir, tiles_file), os.O_RDONLY)
+    
+    def close(self):
+        os.close(self.fd)
+    
+    @property
+    def card_count(self):
+        return self.rows * self.cols
+    
+    def card_box(self, number):
+        """
+        计算第 number 张卡牌的区域，按行优先从 1 开始编号
+        
+        Args:
+            number (int): 卡牌编号
+        
+        Returns:
+            tuple: (left, top, right, bottom)
+        """
+        if not 1 <= number <= self.card_count:
+            raise IndexError(f"卡牌编号超出范围: {number} (共 {self.card_count} 张)")
+        
+        row = (number - 1) // self.cols + 1
+        col = (number - 1) % self.cols + 1
+        return piece_box(self.width, self.height, self.rows, self.cols, row, col)
+    
+    def read_region(self, box):
+        """
+        只解码与区域相交的分块，拼出该区域的图像
+        
+        Args:
+            box (tuple): (left, top, right, bottom)
+        
+        Returns:
+            PIL.Image: 区域图像
+        """
+        left, top, right, bottom = box
+        if right <= left or bottom <= top:
+            raise ValueError(f"区域为空: {box}")
+        
+        size = self.tile_size
+        region = Image.new(self.mode, (right - left, bottom - top))
+        if self.palette is not None:
+            region.putpalette(self.palette)
+        if self.transparency is not None:
+            region.info['transparency'] = self.transparency
+        
+        for tile_row in range(top // size, (bottom - 1) // size + 1):
+            for tile_col in range(left // size, (right - 1) // size + 1):
+                offset, length = self.tiles[tile_row * self.tiles_per_row + tile_col]
+                tile = Image.open(io.BytesIO(os.pread(self.fd, length, offset)))
+                tile.load()
+                region.paste(tile, (tile_col * size - left, tile_row * size - top))
+        
+        return region
+    
+    def encode_card(self, number, compress_level=6):
+        """
+        编码第 number 张卡牌为 PNG
+        
+        Args:
+            number (int): 卡牌编号
+            compress_level (int): PNG 压缩级别
+        
+        Returns:
+            bytes: PNG 数据
+        """
+        buffer = io.BytesIO()
+        self.read_region(self.card_box(number)).save(buffer, format='PNG', compress_level=compress_level)
+        return buffer.getvalue()
+
+
+def same_pixels(a, b):
+    """两张图片的模式、尺寸、像素和透明色是否一致，调色板图片按还原后的颜色比较"""
+    if (a.mode, a.size) != (b.mode, b.size) or a.tobytes() != b.tobytes():
+        return False
+    if a.mode == 'P':
+        return a.convert('RGBA').tobytes() == b.convert('RGBA').tobytes()
+    return a.info.get('transparency') == b.info.get('transparency')
+
+
+def verify_sheet(image_path, store_dir, sheet_id):
+    """
+    检查服务返回的每张卡牌与 cut_image 切出的小图片是否逐像素一致
+    
+    Args:
+        image_path (str): 输入图片路径
+        store_dir (str): 存储目录
+        sheet_id (str): 图片编号
+    
+    Returns:
+        list: 不一致的卡牌编号列表
+    """
+    sheet = TiledSheet(store_dir, sheet_id)
+    mismatched = []
+    
+    try:
+        with open_sheet(image_path) as img:
+            for row, col, piece in iter_pieces(img, sheet.rows, sheet.cols):
+                number = (row - 1) * sheet.cols + col
+                card = Image.open(io.BytesIO(sheet.encode_card(number)))
+                if not same_pixels(card, piece):
+                    mismatched.append(number)
+    finally:
+        sheet.close()
+    
+    if mismatched:
+        print(f"✗ {len(mismatched)} 张卡牌与切分结果不一致: {mismatched}")
+    else:
+        print(f"✓ {sheet.card_count} 张卡牌与切分结果一致")
+    return mismatched
+
+
+def load_store(store_dir):
+    """
+    加载存储目录中的所有图片索引
+    
+    Args:
+        store_dir (str): 存储目录
+    
+    Returns:
+        dict: 图片编号 -> TiledSheet
+    """
+    sheets = {}
+    for filename in sorted(os.listdir(store_dir)):
+        if not filename.endswith('.json'):
+            continue
+        
+        sheet_id = filename[:-len('.json')]
+        try:
+            sheets[sheet_id] = TiledSheet(store_dir, sheet_id)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            # 不是图片索引、索引损坏或缺少对应的 .tiles 文件
+            print(f"? 跳过无效的索引 {filename}: {e}")
+    return sheets
@@ -5,6 +5,7 @@
 
 import os
 import glob
+import argparse
 
 def format_size(size_bytes):
     """格式化文件大小"""
@@ -14,9 +15,8 @@ def format_size(size_bytes):
         size_bytes /= 1024.0
     return f"{size_bytes:.1f} TB"
 
-def compare_files():
-    """比较 character-mats 文件夹中的 JPG 和 PNG 文件"""
-    base_dir = "assets/character-mats"
+def compare_files(base_dir="assets/character-mats"):
+    """比较 base_dir 文件夹中的 JPG 和 PNG 文件 (默认: character-mats)"""
     
     # 查找所有 JPG 文件
     jpg_files = glob.glob(os.path.join(base_dir, "**/*.jpg"), recursive=True)
@@ -61,5 +61,17 @@ def compare_files():
     print(f"  总 PNG 大小: {format_size(total_png_size)}")
     print(f"  大小变化: {format_size(total_png_size - total_jpg_size)} ({((total_png_size / total_jpg_size) - 1) * 100:+.1f}%)")
 
+def add_arguments(parser):
+    parser.add_argument("directory", nargs='?', default="assets/character-mats",
+                        help="比较目录 (默认: assets/character-mats)")
+
+def run(args):
+    compare_files(args.directory)
+
+def main():
+    parser = argparse.ArgumentParser(description="比较 JPG 和 PNG 文件大小")
+    add_arguments(parser)
+    run(parser.parse_args())
+
 if __name__ == "__main__":
-    compare_files()
\ No newline at end of file
+    main()
\ No newline at end of file
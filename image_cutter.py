@@ -6,9 +6,89 @@
 
 import os
 import sys
-from PIL import Image
 import argparse
 
+# 可以直接保存为 PNG 的图像模式，这些模式保持不变
+SHEET_MODES = ['1', 'L', 'LA', 'I', 'I;16', 'P', 'RGB', 'RGBA']
+
+
+def open_sheet(image_path):
+    """
+    打开并解码整张图片，cut_image、流水线和分块存储都使用这里的结果以保证切出的图片一致
+    
+    Args:
+        image_path (str): 输入图片路径
+    
+    Returns:
+        PIL.Image: 已解码的图片，模式为 SHEET_MODES 之一
+    """
+    from PIL import Image
+    
+    img = Image.open(image_path)
+    img.load()
+    
+    # CMYK、YCbCr 等无法保存为 PNG 的模式转换为 RGB(A)
+    if img.mode not in SHEET_MODES:
+        has_alpha = 'A' in img.getbands() or 'transparency' in img.info
+        img = img.convert('RGBA' if has_alpha else 'RGB')
+    
+    return img
+
+
+def piece_box(img_width, img_height, rows, cols, row, col):
+    """
+    计算第 row 行第 col 列小图片在原图中的区域
+    
+    Args:
+        img_width (int): 原图宽度
+        img_height (int): 原图高度
+        rows (int): 切分行数
+        cols (int): 切分列数
+        row (int): 行号 (从 1 开始)
+        col (int): 列号 (从 1 开始)
+    
+    Returns:
+        tuple: (left, top, right, bottom)
+    """
+    # 计算每个小图片的尺寸
+    piece_width = img_width // cols
+    piece_height = img_height // rows
+    
+    # 计算切分区域
+    left = (col - 1) * piece_width
+    top = (row - 1) * piece_height
+    right = left + piece_width
+    bottom = top + piece_height
+    
+    # 如果是最后一列或最后一行，确保包含剩余像素
+    if col == cols:
+        right = img_width
+    if row == rows:
+        bottom = img_height
+    
+    return left, top, right, bottom
+
+
+def iter_pieces(img, rows, cols):
+    """
+    按指定行列数依次切出小图片，不写入磁盘
+    
+    Args:
+        img (PIL.Image): 已打开的图片
+        rows (int): 切分行数
+        cols (int): 切分列数
+    
+    Yields:
+        tuple: (行号, 列号, 小图片)，行号和列号从 1 开始
+    """
+    img_width, img_height = img.size
+    print(f"切分为 {rows} 行 {cols} 列，每个小图片尺寸: {img_width // cols} x {img_height // rows} 像素")
+    
+    for row in range(1, rows + 1):
+        for col in range(1, cols + 1):
+            box = piece_box(img_width, img_height, rows, cols, row, col)
+            yield row, col, img.crop(box)
+
 
 def cut_image(image_path, rows, cols, output_dir=None):
     """
@@ -29,7 +109,7 @@ def cut_image(image_path, rows, cols, output_dir=None):
     
     # 打开图片
     try:
-        img = Image.open(image_path)
+        img = open_sheet(image_path)
         print(f"原图尺寸: {img.size[0]} x {img.size[1]} 像素")
     except Exception as e:
         raise Exception(f"无法打开图片文件: {e}")
@@ -44,55 +124,31 @@ def cut_image(image_path, rows, cols, output_dir=None):
     os.makedirs(output_dir, exist_ok=True)
     print(f"输出目录: {output_dir}")
     
-    # 计算每个小图片的尺寸
-    img_width, img_height = img.size
-    piece_width = img_width // cols
-    piece_height = img_height // rows
-    
-    print(f"切分为 {rows} 行 {cols} 列，每个小图片尺寸: {piece_width} x {piece_height} 像素")
-    
     # 切分图片
     output_files = []
-    for row in range(rows):
-        for col in range(cols):
-            # 计算切分区域
-            left = col * piece_width
-            top = row * piece_height
-            right = left + piece_width
-            bottom = top + piece_height
-            
-            # 如果是最后一列或最后一行，确保包含剩余像素
-            if col == cols - 1:
-                right = img_width
-            if row == rows - 1:
-                bottom = img_height
-            
-            # 切分图片
-            piece = img.crop((left, top, right, bottom))
-            
-            # 生成输出文件名
-            output_filename = f"piece_{row+1:02d}_{col+1:02d}.png"
-            output_path = os.path.join(output_dir, output_filename)
-            
-            # 保存图片
-            piece.save(output_path)
-            output_files.append(output_path)
-            
-            print(f"已生成: {output_filename} (位置: 第{row+1}行第{col+1}列)")
+    for row, col, piece in iter_pieces(img, rows, cols):
+        # 生成输出文件名
+        output_filename = f"piece_{row:02d}_{col:02d}.png"
+        output_path = os.path.join(output_dir, output_filename)
+        
+        # 保存图片
+        piece.save(output_path)
+        output_files.append(output_path)
+        
+        print(f"已生成: {output_filename} (位置: 第{row}行第{col}列)")
     
     print(f"\n切分完成！共生成 {len(output_files)} 张图片")
     return output_files
 
 
-def main():
-    parser = argparse.ArgumentParser(description="图片切分工具")
+def add_arguments(parser):
     parser.add_argument("image_path", help="输入图片路径")
     parser.add_argument("rows", type=int, help="切分行数")
     parser.add_argument("cols", type=int, help="切分列数")
     parser.add_argument("-o", "--output", help="输出目录")
-    
-    args = parser.parse_args()
-    
+
+
+def run(args):
     try:
         output_files = cut_image(args.image_path, args.rows, args.cols, args.output)
         print(f"\n所有图片已保存到: {os.path.dirname(output_files[0])}")
@@ -101,5 +157,11 @@ def main():
         sys.exit(1)
 
 
+def main():
+    parser = argparse.ArgumentParser(description="图片切分工具")
+    add_arguments(parser)
+    run(parser.parse_args())
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -7,7 +7,6 @@ JPG 到 PNG 转换工具
 
 import os
 import sys
-from PIL import Image, ImageOps
 import argparse
 from pathlib import Path
 
@@ -23,6 +22,8 @@ def optimize_png(image, quality_level='high'):
     Returns:
         PIL.Image: 优化后的图像
     """
+    from PIL import Image
+    
     # 如果是 RGBA 模式但没有透明度，转换为 RGB
     if image.mode == 'RGBA':
         # 检查是否有真正的透明像素
@@ -57,6 +58,34 @@ def optimize_png(image, quality_level='high'):
     return image
 
 
+def save_optimized_png(image, output_path, quality_level='high'):
+    """
+    优化已解码的图像并保存为 PNG 文件
+    
+    Args:
+        image (PIL.Image): 输入图像
+        output_path (str): 输出 PNG 文件路径
+        quality_level (str): 质量级别
+    """
+    # 优化图像
+    optimized_img = optimize_png(image, quality_level)
+    
+    # 确保输出目录存在
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    
+    # 保存为 PNG，使用优化参数
+    save_kwargs = {
+        'format': 'PNG',
+        'optimize': True,
+    }
+    
+    # 根据图像模式选择最佳压缩
+    if optimized_img.mode in ['RGB', 'L']:
+        save_kwargs['compress_level'] = 9  # 最高压缩级别
+    
+    optimized_img.save(output_path, **save_kwargs)
+
+
 def convert_jpg_to_png(input_path, output_path, quality_level='high', overwrite=False):
     """
     将 JPG 文件转换为优化的 PNG 文件
@@ -70,6 +99,8 @@ def convert_jpg_to_png(input_path, output_path, quality_level='high', overwrite=
     Returns:
         dict: 转换结果信息
     """
+    from PIL import Image, ImageOps
+    
     try:
         # 检查输出文件是否已存在
         if os.path.exists(output_path) and not overwrite:
@@ -84,23 +115,8 @@ def convert_jpg_to_png(input_path, output_path, quality_level='high', overwrite=
             # 自动旋转图像（基于 EXIF 数据）
             img = ImageOps.exif_transpose(img)
             
-            # 优化图像
-            optimized_img = optimize_png(img, quality_level)
-            
-            # 确保输出目录存在
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            
-            # 保存为 PNG，使用优化参数
-            save_kwargs = {
-                'format': 'PNG',
-                'optimize': True,
-            }
-            
-            # 根据图像模式选择最佳压缩
-            if optimized_img.mode in ['RGB', 'L']:
-                save_kwargs['compress_level'] = 9  # 最高压缩级别
-            
-            optimized_img.save(output_path, **save_kwargs)
+            # 优化并保存图像
+            save_optimized_png(img, output_path, quality_level)
             
             # 获取文件大小信息
             input_size = os.path.getsize(input_path)
@@ -229,8 +245,7 @@ def convert_directory(input_dir, output_dir=None, quality_level='high', overwrit
     }
 
 
-def main():
-    parser = argparse.ArgumentParser(description="JPG 到 PNG 转换工具")
+def add_arguments(parser):
     parser.add_argument("input_dir", nargs='?', default="assets/character-mats",
                        help="输入目录路径 (默认: assets/character-mats)")
     parser.add_argument("-o", "--output", help="输出目录 (默认: 在原位置转换)")
@@ -240,9 +255,9 @@ def main():
                        help="覆盖已存在的 PNG 文件")
     parser.add_argument("--preview", action='store_true',
                        help="预览模式：只显示将要转换的文件，不实际转换")
-    
-    args = parser.parse_args()
-    
+
+
+def run(args):
     # 检查输入目录
     if not os.path.exists(args.input_dir):
         print(f"错误: 输入目录不存在: {args.input_dir}")
@@ -295,5 +310,11 @@ def main():
         sys.exit(1)
 
 
+def main():
+    parser = argparse.ArgumentParser(description="JPG 到 PNG 转换工具")
+    add_arguments(parser)
+    run(parser.parse_args())
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
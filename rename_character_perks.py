@@ -7,10 +7,11 @@
 
 import os
 import re
+import argparse
 
-def rename_character_perks():
-    # 目标目录
-    target_dir = "/Users/bytedance/cutter/assets/character-perks/frosthaven"
+DEFAULT_TARGET_DIR = "/Users/bytedance/cutter/assets/character-perks/frosthaven"
+
+def rename_character_perks(target_dir=DEFAULT_TARGET_DIR):
     
     if not os.path.exists(target_dir):
         print(f"目录不存在: {target_dir}")
@@ -51,5 +52,17 @@ def rename_character_perks():
     
     print(f"\n重命名完成! 成功重命名了 {renamed_count} 个文件。")
 
+def add_arguments(parser):
+    parser.add_argument('directory', nargs='?', default=DEFAULT_TARGET_DIR,
+                        help=f'目标目录路径 (默认: {DEFAULT_TARGET_DIR})')
+
+def run(args):
+    rename_character_perks(args.directory)
+
+def main():
+    parser = argparse.ArgumentParser(description='重命名 character-perks 文件')
+    add_arguments(parser)
+    run(parser.parse_args())
+
 if __name__ == "__main__":
-    rename_character_perks()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -8,6 +8,26 @@ import os
 import re
 import argparse
 
+def cut_image_name(row, col, prefix, suffix, start_number=1):
+    """
+    根据切片的行列号计算新的文件名
+    
+    Args:
+        row: 行号 (从 1 开始)
+        col: 列号 (从 1 开始)
+        prefix: 前缀
+        suffix: 后缀
+        start_number: 起始编号 (默认为1)
+    
+    Returns:
+        str: 新文件名
+    """
+    # 根据规则计算新的编号
+    # 通用公式：piece_XX_YY.png -> fh-{prefix}-(start_number+(XX-1)*10+YY-1)-{suffix}.png
+    new_number = start_number + (row - 1) * 10 + col - 1
+    
+    return f"fh-{prefix}-{new_number:02d}-{suffix}.png"
+
 def rename_cut_images(target_dir, prefix, suffix, start_number=1):
     """
     重命名切片图片
@@ -46,11 +66,7 @@ def rename_cut_images(target_dir, prefix, suffix, start_number=1):
             row = int(match.group(1))
             col = int(match.group(2))
             
-            # 根据规则计算新的编号
-            # 通用公式：piece_XX_YY.png -> fh-{prefix}-(start_number+(XX-1)*10+YY-1)-{suffix}.png
-            new_number = start_number + (row - 1) * 10 + col - 1
-            
-            new_filename = f"fh-{prefix}-{new_number:02d}-{suffix}.png"
+            new_filename = cut_image_name(row, col, prefix, suffix, start_number)
             new_path = os.path.join(target_dir, new_filename)
             
             try:
@@ -64,15 +80,13 @@ def rename_cut_images(target_dir, prefix, suffix, start_number=1):
     
     print(f"\n重命名完成! 成功重命名了 {renamed_count} 个文件。")
 
-def main():
-    parser = argparse.ArgumentParser(description='重命名切片图片文件')
+def add_arguments(parser):
     parser.add_argument('directory', help='目标目录路径')
     parser.add_argument('prefix', help='文件名前缀 (如: be, oe, re)')
     parser.add_argument('suffix', help='文件名后缀 (如: f, b)')
     parser.add_argument('--start', type=int, default=1, help='起始编号 (默认为1)')
-    
-    args = parser.parse_args()
-    
+
+def run(args):
     print("=" * 60)
     print("通用切片图片重命名工具")
     print("=" * 60)
@@ -85,5 +99,10 @@ def main():
     
     rename_cut_images(args.directory, args.prefix, args.suffix, args.start)
 
+def main():
+    parser = argparse.ArgumentParser(description='重命名切片图片文件')
+    add_arguments(parser)
+    run(parser.parse_args())
+
 if __name__ == "__main__":
     main()
\ No newline at end of file